@@ -117,23 +117,24 @@ def write_memory_segmented(segment, offset, value):
     else:
         raise ValueError("Invalid segment or offset")
 
-# Unified Example Program
-program = [
-    "LOAD R1 10",      # Load 10 into R1
-    "LOAD R2 20",      # Load 20 into R2
-    "ADD R3 R1 R2",    # R3 = R1 + R2
-    "STORE R3 100",    # Store R3's value into memory address 100
-    "INPUT R4",        # Take input and store in R4
-    "OUTPUT R4",       # Display the value of R4
-    "HALT"             # Stop execution
-]
-
-# Initialize CPU and run
-cpu = CPU(program)
-cpu.run()
-
-# Memory Operations Example (Using Same Context)
-print("Memory[100]:", read_memory(100))  # Output: 30 (from the CPU program execution)
-
-write_memory_segmented(0, 50, read_memory(100))  # Store the result (30) in segmented memory
-print("Segmented Memory[0, 50]:", read_memory_segmented(0, 50))  # Output: 30
+if __name__ == "__main__":
+    # Unified Example Program
+    program = [
+        "LOAD R1 10",      # Load 10 into R1
+        "LOAD R2 20",      # Load 20 into R2
+        "ADD R3 R1 R2",    # R3 = R1 + R2
+        "STORE R3 100",    # Store R3's value into memory address 100
+        "INPUT R4",        # Take input and store in R4
+        "OUTPUT R4",       # Display the value of R4
+        "HALT"             # Stop execution
+    ]
+
+    # Initialize CPU and run
+    cpu = CPU(program)
+    cpu.run()
+
+    # Memory Operations Example (Using Same Context)
+    print("Memory[100]:", read_memory(100))  # Output: 30 (from the CPU program execution)
+
+    write_memory_segmented(0, 50, read_memory(100))  # Store the result (30) in segmented memory
+    print("Segmented Memory[0, 50]:", read_memory_segmented(0, 50))  # Output: 30